@@ -5,207 +5,351 @@ Downloads box art thumbnails from the NES games listing page.
 Rate limited to max 3 images per second.
 """
 
+import argparse
 import asyncio
 import json
 import os
 import re
 import time
+from collections import Counter
+from http.cookies import Morsel
 from pathlib import Path
 from urllib.parse import urljoin, urlparse
 
 import aiofiles
-from bs4 import BeautifulSoup
-from playwright.async_api import async_playwright, Page
+import aiohttp
+import orjson
+from playwright.async_api import async_playwright, Page, Route
+from yarl import URL
 
 # Configuration
 BASE_URL = "https://rec0ded88.com/play-nes-games/"
 OUTPUT_DIR = Path(__file__).parent / "box-art"
 PROGRESS_FILE = Path(__file__).parent / "progress.json"
-RATE_LIMIT_DELAY = 0.34  # ~3 images per second (1/3 second between downloads)
+GAMES_CACHE = Path(__file__).parent / "games.json"
+GAMES_CACHE_TTL = 24 * 60 * 60  # Seconds before the cached game list is rescraped
+RATE_LIMIT = 3.0  # Max images per second, per host
+RATE_LIMIT_BURST = 3  # Downloads allowed back-to-back to one host before throttling kicks in
+MAX_CONCURRENT_DOWNLOADS = 8  # Cap on in-flight image requests
+PROGRESS_SAVE_INTERVAL = 50  # Downloads between progress saves
+DOWNLOAD_CHUNK_SIZE = 64 * 1024  # Bytes per streamed write
+DOWNLOAD_ATTEMPTS = 3  # Tries per image before giving up
+RETRY_BACKOFF = 0.5  # Seconds before the first retry, doubled on each further retry
+HEADFUL = os.environ.get("STEALTH") == "1"  # Show the browser window during scraping
+USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
 
 # Alphabetical pagination values from the site
 PAGINATION_TABS = ["ALL"]  # Start with ALL to get everything in one go
 
+# Path segment that marks NES box art images (they live in NES_Covers-2D)
+_COVER_KEY = 'NES_Covers'
+
+# Image extensions kept as-is by get_extension
+_ALLOWED_EXTS = frozenset(['.jpg', '.jpeg', '.png', '.gif', '.webp', '.bmp'])
+
+# Tables and patterns used by sanitize_filename, built once
+_BAD_CHARS = str.maketrans('', '', '<>:"/\\|?*')
+_RE_SPACE = re.compile(r'\s+')
+_RE_DASHES = re.compile(r'-+')
+
 
 def sanitize_filename(name: str) -> str:
     """Convert game title to a safe filename."""
     # Remove or replace invalid characters
-    name = re.sub(r'[<>:"/\\|?*]', '', name)
-    name = re.sub(r'\s+', '-', name.strip())
-    name = re.sub(r'-+', '-', name)
+    name = name.translate(_BAD_CHARS)
+    name = _RE_SPACE.sub('-', name.strip())
+    name = _RE_DASHES.sub('-', name)
     name = name.strip('-')
     return name.lower()[:100]  # Limit length
 
 
 def get_extension(url: str) -> str:
     """Extract file extension from URL."""
-    parsed = urlparse(url)
-    path = parsed.path
-    ext = os.path.splitext(path)[1].lower()
-    if ext in ['.jpg', '.jpeg', '.png', '.gif', '.webp', '.bmp']:
+    # Plain string splits are enough for image URLs - no need for urlparse
+    path = url.partition('?')[0].partition('#')[0]
+    _, _, tail = path.rpartition('/')
+    _, dot, ext = tail.rpartition('.')
+    ext = '.' + ext.lower() if dot else ''
+    if ext in _ALLOWED_EXTS:
         return ext
     return '.jpg'  # Default
 
 
+class AsyncTokenBucket:
+    """Token bucket rate limiter for use across async tasks."""
+
+    def __init__(self, max_tokens: int, fill_rate: float):
+        self.max_tokens = max_tokens
+        self.fill_rate = fill_rate  # Tokens added per second
+        self.current_tokens = float(max_tokens)
+        self.timestamp = time.monotonic()
+
+    async def consume(self, n: int = 1) -> None:
+        """Wait until n tokens are available, then take them."""
+        while True:
+            now = time.monotonic()
+            delta = self.fill_rate * (now - self.timestamp)
+            self.current_tokens = min(self.max_tokens, self.current_tokens + delta)
+            self.timestamp = now
+
+            if self.current_tokens >= n:
+                self.current_tokens -= n
+                return
+
+            await asyncio.sleep(1 / self.fill_rate)
+
+
+class HostRateLimiter:
+    """Keeps a separate token bucket per host, so each host is throttled independently."""
+
+    def __init__(self, max_tokens: int, fill_rate: float):
+        self.max_tokens = max_tokens
+        self.fill_rate = fill_rate
+        self.buckets: dict[str, AsyncTokenBucket] = {}
+
+    async def consume(self, host: str, n: int = 1) -> None:
+        """Wait until n tokens are available for host, then take them."""
+        bucket = self.buckets.get(host)
+        if bucket is None:
+            bucket = self.buckets[host] = AsyncTokenBucket(self.max_tokens, self.fill_rate)
+        await bucket.consume(n)
+
+
 async def load_progress() -> dict:
     """Load progress from file to enable resumability."""
     if PROGRESS_FILE.exists():
-        async with aiofiles.open(PROGRESS_FILE, 'r') as f:
-            content = await f.read()
-            return json.loads(content)
+        content = await asyncio.to_thread(PROGRESS_FILE.read_bytes)
+        return orjson.loads(content)
     return {"downloaded": [], "failed": []}
 
 
-async def save_progress(progress: dict) -> None:
-    """Save progress to file."""
-    async with aiofiles.open(PROGRESS_FILE, 'w') as f:
-        await f.write(json.dumps(progress, indent=2))
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write data to a temp file beside path, then swap it into place."""
+    tmp_file = path.with_suffix('.tmp')
+    tmp_file.write_bytes(data)
+    os.replace(tmp_file, path)
+
 
+async def save_progress(downloaded: set[str], failed: list[dict]) -> None:
+    """Save progress to file, atomically replacing the previous copy."""
+    # Serialize on the event loop so the snapshot is consistent, write off it
+    data = orjson.dumps(
+        {"downloaded": sorted(downloaded), "failed": failed},
+        option=orjson.OPT_APPEND_NEWLINE,
+    )
+    await asyncio.to_thread(_write_atomic, PROGRESS_FILE, data)
 
-async def download_image(page: Page, url: str, filepath: Path, progress: dict) -> bool:
-    """Download a single image using the browser context."""
+
+def load_games_cache() -> tuple[list[dict], list[dict], float] | None:
+    """Return (games, cookies, scraped_at) from the cache if the game list is still fresh."""
+    if not GAMES_CACHE.exists():
+        return None
     try:
-        # Use the browser to fetch the image (bypasses Cloudflare for same-origin)
-        response = await page.request.get(url)
+        cached = json.loads(GAMES_CACHE.read_text())
+        games, cookies, scraped_at = cached["games"], cached["cookies"], cached["scraped_at"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None  # Corrupt or old-format cache - treat as a miss
+    if time.time() - scraped_at >= GAMES_CACHE_TTL:
+        return None
+    return games, cookies, scraped_at
+
+
+def save_games_cache(games: list[dict], cookies: list[dict], scraped_at: float) -> None:
+    """Cache the scraped game list and clearance cookies so reruns skip the browser."""
+    GAMES_CACHE.write_text(json.dumps({"games": games, "cookies": cookies, "scraped_at": scraped_at}))
+
+
+def cookies_expired(cookies: list[dict]) -> bool:
+    """Check whether any of the cached cookies has passed its expiry time."""
+    # Playwright reports session cookies with expires == -1
+    now = time.time()
+    return any(0 < cookie.get('expires', -1) <= now for cookie in cookies)
 
-        if response.ok:
-            content = await response.body()
-            async with aiofiles.open(filepath, 'wb') as f:
-                await f.write(content)
+
+class ClearanceRejected(Exception):
+    """Raised when Cloudflare rejects the clearance cookies with HTTP 403."""
+
+
+async def _fetch_image(session: aiohttp.ClientSession, url: str, filepath: Path) -> None:
+    """Stream one image to disk, raising on any HTTP or network error."""
+    # Stream into a .part file so an interrupted download never looks complete
+    part_file = filepath.with_name(filepath.name + '.part')
+    try:
+        async with session.get(url) as response:
+            response.raise_for_status()
+            async with aiofiles.open(part_file, 'wb') as f:
+                async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                    await f.write(chunk)
+        os.replace(part_file, filepath)
+    except BaseException:
+        part_file.unlink(missing_ok=True)
+        raise
+
+
+async def download_image(
+    session: aiohttp.ClientSession, limiter: HostRateLimiter, url: str, filepath: Path
+) -> bool:
+    """Download a single image, retrying transient failures with exponential backoff."""
+    host = urlparse(url).netloc
+    for attempt in range(DOWNLOAD_ATTEMPTS):
+        # Every attempt is a request, so retries are rate limited too
+        await limiter.consume(host)
+        try:
+            await _fetch_image(session, url, filepath)
             return True
-        else:
-            print(f"  Failed to download {url}: HTTP {response.status}")
+        except aiohttp.ClientResponseError as e:
+            # Expired clearance cookies - the caller needs fresh ones, not a retry
+            if e.status == 403:
+                raise ClearanceRejected(url) from e
+            # Client errors (other than rate limiting) won't fix themselves
+            if e.status < 500 and e.status != 429:
+                print(f"  Failed to download {url}: HTTP {e.status}")
+                return False
+            error = f"HTTP {e.status}"
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            error = e
+        except Exception as e:
+            print(f"  Error downloading {url}: {e}")
             return False
-    except Exception as e:
-        print(f"  Error downloading {url}: {e}")
-        return False
 
+        if attempt < DOWNLOAD_ATTEMPTS - 1:
+            await asyncio.sleep(RETRY_BACKOFF * 2 ** attempt)
 
-async def extract_games_from_page(page: Page) -> list[dict]:
-    """Extract game titles and image URLs from the current page."""
-    games = []
+    print(f"  Error downloading {url} after {DOWNLOAD_ATTEMPTS} attempts: {error}")
+    return False
+
+
+def create_download_session(cookies: list[dict]) -> aiohttp.ClientSession:
+    """Build an HTTP session that reuses the browser's Cloudflare clearance cookies."""
+    jar = aiohttp.CookieJar()
+    for cookie in cookies:
+        morsel = Morsel()
+        morsel.set(cookie['name'], cookie['value'], cookie['value'])
+        morsel['path'] = cookie.get('path', '/')
+        # Leading-dot cookies cover subdomains too; the rest stay host-only
+        if cookie['domain'].startswith('.'):
+            morsel['domain'] = cookie['domain']
+        if cookie.get('secure'):
+            morsel['secure'] = True
+        jar.update_cookies({cookie['name']: morsel}, URL(f"https://{cookie['domain'].lstrip('.')}/"))
 
-    # Get page content
-    content = await page.content()
-    soup = BeautifulSoup(content, 'html.parser')
+    return aiohttp.ClientSession(
+        headers={"User-Agent": USER_AGENT, "Referer": BASE_URL},
+        connector=aiohttp.TCPConnector(limit=10, ttl_dns_cache=300),
+        cookie_jar=jar,
+    )
 
+
+async def extract_games_from_page(page: Page) -> list[dict]:
+    """Extract game titles and image URLs from the current page."""
     # Direct approach: find all images that are NES covers
-    # This is more reliable than relying on specific container classes
-    images = soup.find_all('img')
+    # This is more reliable than relying on specific container classes.
+    # Attributes are read inside the browser so the DOM is never serialized to Python.
+    images = await page.eval_on_selector_all(
+        'img',
+        "els => els.map(e => [e.getAttribute('src') || e.getAttribute('data-src') || '', e.getAttribute('alt') || ''])",
+    )
     print(f"  Found {len(images)} total images on page")
 
-    for img in images:
-        src = img.get('src', '') or img.get('data-src', '')
-        if not src:
-            continue
+    # Only include NES cover images (they're in NES_Covers-2D folder)
+    covers = ((src, alt) for src, alt in images if src and _COVER_KEY in src)
 
-        # Only include NES cover images (they're in NES_Covers-2D folder)
-        if 'NES_Covers' not in src:
+    # Keyed by image URL, which deduplicates in one pass while keeping page order
+    games: dict[str, dict] = {}
+    for src, alt in covers:
+        # Make URL absolute
+        full_url = urljoin(BASE_URL, src)
+        if full_url in games:
             continue
 
         # Get title from alt attribute
-        title = img.get('alt', '')
+        title = alt
         if not title:
             # Extract from filename as fallback
-            filename = src.split('/')[-1]
-            title = filename.replace('.png', '').replace('.jpg', '').replace('-USA', '').replace('-', ' ')
+            filename = src.rpartition('/')[2]
+            title = filename.removesuffix('.png').removesuffix('.jpg').replace('-USA', '').replace('-', ' ')
 
-        if src and title:
-            # Make URL absolute
-            full_url = urljoin(BASE_URL, src)
-            games.append({
+        if title:
+            games[full_url] = {
                 'title': title,
                 'image_url': full_url
-            })
-
-    print(f"  Found {len(games)} NES cover images")
+            }
 
-    # Deduplicate by image URL
-    seen_urls = set()
-    unique_games = []
-    for game in games:
-        if game['image_url'] not in seen_urls:
-            seen_urls.add(game['image_url'])
-            unique_games.append(game)
+    print(f"  Found {len(games)} unique NES cover images")
 
-    return unique_games
+    return list(games.values())
 
 
 async def scroll_to_load_all(page: Page) -> None:
     """Scroll down the page slowly to trigger lazy loading of all content."""
-    # Get total height
-    total_height = await page.evaluate("document.body.scrollHeight")
-    viewport_height = await page.evaluate("window.innerHeight")
-
-    # Scroll incrementally to trigger lazy loading
-    current_pos = 0
-    scroll_step = viewport_height // 2  # Scroll half a viewport at a time
-
-    print(f"  Scrolling through page (height: {total_height}px)...")
-
-    while current_pos < total_height:
-        current_pos += scroll_step
-        await page.evaluate(f"window.scrollTo(0, {current_pos})")
-        await asyncio.sleep(0.3)  # Wait for lazy load to trigger
-
-        # Update total height in case content loaded dynamically
-        new_height = await page.evaluate("document.body.scrollHeight")
-        if new_height > total_height:
-            total_height = new_height
-
-    # Scroll back to top and do one more full scroll
-    await page.evaluate("window.scrollTo(0, 0)")
-    await asyncio.sleep(0.5)
-
-    # Second pass - scroll all the way down slowly
-    total_height = await page.evaluate("document.body.scrollHeight")
-    current_pos = 0
-    while current_pos < total_height:
-        current_pos += scroll_step
-        await page.evaluate(f"window.scrollTo(0, {current_pos})")
-        await asyncio.sleep(0.2)
-
-    # Wait for any remaining lazy loads
-    await asyncio.sleep(1)
-
-    # Scroll back to top
-    await page.evaluate("window.scrollTo(0, 0)")
-    await asyncio.sleep(0.3)
-
-
-async def main():
-    """Main scraper function."""
-    print("=" * 60)
-    print("NES Box Art Scraper")
-    print("=" * 60)
-
-    # Create output directory
-    OUTPUT_DIR.mkdir(exist_ok=True)
-
-    # Load progress
-    progress = await load_progress()
-    downloaded_set = set(progress["downloaded"])
-
-    print(f"Previously downloaded: {len(downloaded_set)} images")
-    print(f"Output directory: {OUTPUT_DIR}")
-    print()
-
-    all_games = []
-
+    print("  Scrolling through page...")
+
+    # Run the whole scroll inside the page as a single evaluate - Playwright awaits
+    # the returned promise, so there is one round-trip instead of one per step.
+    # Scrolls half a viewport at a time until the bottom stops moving, then waits
+    # for the DOM to go quiet.
+    total_height = await page.evaluate("""async () => {
+        const step = window.innerHeight / 2;
+        let pos = 0;
+        while (pos < document.body.scrollHeight) {
+            pos += step;
+            window.scrollTo(0, pos);
+            await new Promise(r => setTimeout(r, 250));
+        }
+
+        // Debounced settle: resolve once no mutations for 500ms (capped at 5s)
+        await new Promise(resolve => {
+            let quiet = setTimeout(done, 500);
+            const cap = setTimeout(done, 5000);
+            const observer = new MutationObserver(() => {
+                clearTimeout(quiet);
+                quiet = setTimeout(done, 500);
+            });
+            function done() {
+                observer.disconnect();
+                clearTimeout(quiet);
+                clearTimeout(cap);
+                resolve();
+            }
+            observer.observe(document.body, {childList: true, subtree: true, attributes: true});
+        });
+
+        window.scrollTo(0, 0);
+        return document.body.scrollHeight;
+    }""")
+    print(f"  Scrolled page (height: {total_height}px)")
+
+
+async def _block_images(route: Route) -> None:
+    """Abort image requests and let everything else through."""
+    if route.request.resource_type == "image":
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def scrape_games(cookies_only: bool = False) -> tuple[list[dict], list[dict]]:
+    """Open the listing page in a browser and return (games, cookies).
+
+    With cookies_only, stop once Cloudflare has cleared and return no games.
+    """
     async with async_playwright() as p:
         # Launch browser with stealth settings to bypass Cloudflare
         print("Launching browser...")
         browser = await p.chromium.launch(
-            headless=False,  # Must be False for Cloudflare bypass
+            headless=not HEADFUL,  # Set STEALTH=1 if Cloudflare needs a visible browser
             args=[
                 "--disable-blink-features=AutomationControlled",
                 "--disable-dev-shm-usage",
                 "--no-sandbox",
+                # Only the image URLs are needed here, not the pixels
+                "--blink-settings=imagesEnabled=false",
+                "--disable-gpu",
             ]
         )
 
         context = await browser.new_context(
-            user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+            user_agent=USER_AGENT,
             viewport={"width": 1920, "height": 1080},
             locale="en-US",
             timezone_id="America/New_York",
@@ -229,6 +373,9 @@ async def main():
             });
         """)
 
+        # Don't fetch image bytes while scraping - they're downloaded over HTTP afterwards
+        await context.route("**/*", _block_images)
+
         page = await context.new_page()
 
         try:
@@ -240,26 +387,24 @@ async def main():
             # Wait for Cloudflare challenge to complete - needs more time
             print("Waiting for Cloudflare check to complete (this may take 10-15 seconds)...")
 
-            # Poll until we see game content or timeout
-            max_wait = 30  # seconds
-            waited = 0
-            while waited < max_wait:
-                await asyncio.sleep(2)
-                waited += 2
-                page_content = await page.content()
-
-                # Check if the page has loaded actual game content
-                if "Play NES Games" in page_content and "10-Yard" in page_content:
-                    print(f"Page loaded successfully after {waited}s")
-                    break
-
-                # Check if still on challenge
-                if "challenge" in page_content.lower() or "checking" in page_content.lower():
-                    print(f"  Still waiting for Cloudflare... ({waited}s)")
-                    continue
-
-            # Wait a bit more for all images to render
-            await asyncio.sleep(3)
+            # Let the browser wake us up instead of polling page.content()
+            started = time.monotonic()
+            try:
+                await page.wait_for_function(
+                    "() => !/just a moment|checking/i.test(document.title)",
+                    timeout=30000,
+                )
+                print(f"  Cloudflare check passed after {time.monotonic() - started:.1f}s")
+                await page.wait_for_function(
+                    "() => document.body && document.body.innerText.includes('10-Yard')",
+                    timeout=max(1000, 30000 - int((time.monotonic() - started) * 1000)),
+                )
+                print(f"Page loaded successfully after {time.monotonic() - started:.1f}s")
+            except Exception:
+                print(f"Warning: Game content not detected after {time.monotonic() - started:.0f}s, continuing anyway...")
+
+            if cookies_only:
+                return [], await context.cookies()
 
             # Wait for game content to appear
             print("Waiting for game images to load...")
@@ -302,70 +447,10 @@ async def main():
                 async with aiofiles.open(OUTPUT_DIR.parent / "debug_page.html", 'w') as f:
                     await f.write(content)
                 print("Saved to debug_page.html")
-                return
 
-            # Download images
-            print()
-            print("Starting downloads (rate limited to 3/second)...")
-            print("-" * 60)
-
-            downloaded_count = 0
-            skipped_count = 0
-            failed_count = 0
-
-            for i, game in enumerate(all_games, 1):
-                title = game['title']
-                image_url = game['image_url']
-
-                # Check if already downloaded
-                if image_url in downloaded_set:
-                    skipped_count += 1
-                    continue
-
-                # Prepare filename
-                safe_name = sanitize_filename(title)
-                ext = get_extension(image_url)
-                filepath = OUTPUT_DIR / f"{safe_name}{ext}"
-
-                # Handle duplicate filenames
-                counter = 1
-                while filepath.exists():
-                    filepath = OUTPUT_DIR / f"{safe_name}-{counter}{ext}"
-                    counter += 1
-
-                print(f"[{i}/{len(all_games)}] {title[:40]:<40} ", end="", flush=True)
-
-                # Download
-                success = await download_image(page, image_url, filepath, progress)
-
-                if success:
-                    downloaded_count += 1
-                    progress["downloaded"].append(image_url)
-                    print("✓")
-                else:
-                    failed_count += 1
-                    progress["failed"].append({"title": title, "url": image_url})
-                    print("✗")
-
-                # Save progress periodically
-                if (downloaded_count + failed_count) % 10 == 0:
-                    await save_progress(progress)
-
-                # Rate limiting
-                await asyncio.sleep(RATE_LIMIT_DELAY)
-
-            # Final progress save
-            await save_progress(progress)
-
-            print()
-            print("=" * 60)
-            print("COMPLETE")
-            print("=" * 60)
-            print(f"Downloaded: {downloaded_count}")
-            print(f"Skipped (already had): {skipped_count}")
-            print(f"Failed: {failed_count}")
-            print(f"Total games found: {len(all_games)}")
-            print(f"Output directory: {OUTPUT_DIR}")
+            # Grab the Cloudflare clearance cookies for the HTTP downloads
+            cookies = await context.cookies()
+            return all_games, cookies
 
         except Exception as e:
             print(f"Error: {e}")
@@ -374,5 +459,184 @@ async def main():
             await browser.close()
 
 
+async def main(force_rescrape: bool = False):
+    """Main scraper function."""
+    print("=" * 60)
+    print("NES Box Art Scraper")
+    print("=" * 60)
+
+    # Create output directory
+    OUTPUT_DIR.mkdir(exist_ok=True)
+
+    # Load progress
+    progress = await load_progress()
+    downloaded_set: set[str] = set(progress.get("downloaded", []))
+    failed_list: list[dict] = progress.get("failed", [])
+
+    print(f"Previously downloaded: {len(downloaded_set)} images")
+    print(f"Output directory: {OUTPUT_DIR}")
+    print()
+
+    all_games = None
+    if not force_rescrape:
+        cached = load_games_cache()
+        if cached:
+            all_games, cookies, scraped_at = cached
+            print(f"Using cached game list from {GAMES_CACHE.name} ({len(all_games)} games)")
+
+            # The game list outlives Cloudflare's clearance cookies
+            if cookies_expired(cookies):
+                print("Cached Cloudflare cookies have expired, getting fresh ones...")
+                _, cookies = await scrape_games(cookies_only=True)
+                save_games_cache(all_games, cookies, scraped_at)
+
+    if all_games is None:
+        scraped_at = time.time()
+        all_games, cookies = await scrape_games()
+        if not all_games:
+            return
+        save_games_cache(all_games, cookies, scraped_at)
+
+    # Download images
+    print()
+    print(f"Starting downloads (rate limited to {RATE_LIMIT:g}/second per host)...")
+    print("-" * 60)
+
+    downloaded_count = 0
+    skipped_count = 0
+    failed_count = 0
+    limiter = HostRateLimiter(RATE_LIMIT_BURST, RATE_LIMIT)
+    sem = asyncio.BoundedSemaphore(MAX_CONCURRENT_DOWNLOADS)
+    progress_lock = asyncio.Lock()
+
+    # Work out filenames up front so concurrent tasks never race on the same path.
+    # One directory scan replaces a stat() per candidate name.
+    pending = []
+    with os.scandir(OUTPUT_DIR) as entries:
+        existing_sizes = {entry.name: entry.stat().st_size for entry in entries if entry.is_file()}
+    used_names = set(existing_sizes)
+
+    # How many games on the page share each base filename
+    base_counts = Counter(
+        f"{sanitize_filename(game['title'])}{get_extension(game['image_url'])}" for game in all_games
+    )
+
+    for i, game in enumerate(all_games, 1):
+        title = game['title']
+        image_url = game['image_url']
+
+        # Check if already downloaded
+        if image_url in downloaded_set:
+            skipped_count += 1
+            continue
+
+        # Prepare filename
+        safe_name = sanitize_filename(title)
+        ext = get_extension(image_url)
+        filename = f"{safe_name}{ext}"
+
+        # A previous run may have saved the file but crashed before recording it.
+        # Only trust that when no other game could own the same filename.
+        if base_counts[filename] == 1 and existing_sizes.get(filename, 0) > 0:
+            downloaded_set.add(image_url)
+            skipped_count += 1
+            continue
+
+        # Handle duplicate filenames - avoid files on disk and names claimed this run
+        counter = 1
+        while filename in used_names:
+            filename = f"{safe_name}-{counter}{ext}"
+            counter += 1
+        used_names.add(filename)
+
+        pending.append((i, title, image_url, OUTPUT_DIR / filename))
+
+    clearance_rejected = asyncio.Event()
+    blocked = []
+
+    async def _record(i: int, title: str, image_url: str, success: bool) -> None:
+        nonlocal downloaded_count, failed_count
+
+        async with progress_lock:
+            if success:
+                downloaded_count += 1
+                downloaded_set.add(image_url)
+            else:
+                failed_count += 1
+                failed_list.append({"title": title, "url": image_url})
+            print(f"[{i}/{len(all_games)}] {title[:40]:<40} {'✓' if success else '✗'}")
+
+            # Save progress periodically
+            # A failed save must not cancel the other downloads in the TaskGroup
+            if (downloaded_count + failed_count) % PROGRESS_SAVE_INTERVAL == 0:
+                try:
+                    await save_progress(downloaded_set, failed_list)
+                except Exception as e:
+                    print(f"  Warning: Could not save progress: {e}")
+
+    async def _one(
+        session: aiohttp.ClientSession, i: int, title: str, image_url: str, filepath: Path
+    ) -> None:
+        async with sem:
+            # Once Cloudflare starts rejecting the cookies, hold the rest for a retry
+            if clearance_rejected.is_set():
+                blocked.append((i, title, image_url, filepath))
+                return
+            try:
+                success = await download_image(session, limiter, image_url, filepath)
+            except ClearanceRejected:
+                clearance_rejected.set()
+                blocked.append((i, title, image_url, filepath))
+                return
+
+        await _record(i, title, image_url, success)
+
+    # Fetch images directly over HTTP using the Cloudflare clearance cookies.
+    # If Cloudflare rejects them, get fresh cookies once and retry the held jobs.
+    try:
+        jobs = pending
+        refreshed = False
+        while jobs:
+            async with create_download_session(cookies) as session:
+                async with asyncio.TaskGroup() as tg:
+                    for job in jobs:
+                        tg.create_task(_one(session, *job))
+
+            if not blocked:
+                break
+            if refreshed:
+                for i, title, image_url, _ in blocked:
+                    print(f"  Failed to download {image_url}: HTTP 403")
+                    await _record(i, title, image_url, False)
+                break
+
+            print("Cloudflare rejected the cookies (HTTP 403), getting fresh ones...")
+            _, cookies = await scrape_games(cookies_only=True)
+            save_games_cache(all_games, cookies, scraped_at)
+            refreshed = True
+            jobs, blocked = blocked, []
+            clearance_rejected.clear()
+    finally:
+        # Final progress save, even if interrupted
+        await save_progress(downloaded_set, failed_list)
+
+    print()
+    print("=" * 60)
+    print("COMPLETE")
+    print("=" * 60)
+    print(f"Downloaded: {downloaded_count}")
+    print(f"Skipped (already had): {skipped_count}")
+    print(f"Failed: {failed_count}")
+    print(f"Total games found: {len(all_games)}")
+    print(f"Output directory: {OUTPUT_DIR}")
+
+
 if __name__ == "__main__":
-    asyncio.run(main())
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--force-rescrape",
+        action="store_true",
+        help="Ignore the cached game list and scrape the page again",
+    )
+    args = parser.parse_args()
+    asyncio.run(main(force_rescrape=args.force_rescrape))